@@ -1,5 +1,13 @@
-from langgraph_gen._version import __version__
-
 __all__ = [
     "__version__",
 ]
+
+
+def __getattr__(name: str) -> str:
+    # Resolve the version lazily: importlib.metadata is slow to import and
+    # the CLI imports this package on every invocation.
+    if name == "__version__":
+        from langgraph_gen._version import __version__
+
+        return __version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,96 @@
+"""Pre-compiled `py-stub-impl.j2` template.
+
+This is an automatically generated file. Do not modify it.
+To regenerate this file, run `scripts/freeze_templates.py`.
+"""
+
+CHECKSUM = "0f85f1b228f33b07e61c8e43685e356a30bf425d"
+
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'py-stub-impl.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_version = resolve('version')
+    l_0_stub_module = resolve('stub_module')
+    l_0_stub_name = resolve('stub_name')
+    l_0_nodes = resolve('nodes')
+    l_0_edges = resolve('edges')
+    try:
+        t_1 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    pass
+    yield '"""This file was generated using `langgraph-gen` version '
+    yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+    yield '.\n\nThis file provides a placeholder implementation for the corresponding stub.\n\nReplace the placeholder implementation with your own logic.\n"""\n\nfrom typing_extensions import TypedDict\n\n'
+    if (undefined(name='stub_module') if l_0_stub_module is missing else l_0_stub_module):
+        pass
+        yield 'from '
+        yield str((undefined(name='stub_module') if l_0_stub_module is missing else l_0_stub_module))
+        yield ' import '
+        yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+        yield '\n'
+    else:
+        pass
+        yield '# Update the import path\n# from [path to your stub] import '
+        yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+        yield '\n'
+    yield '\n\nclass SomeState(TypedDict):\n    # define your attributes here\n    foo: str\n\n\n# Define stand-alone functions\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield 'def '
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield '(state: SomeState) -> dict:\n    print("In node: '
+        yield str(environment.getattr(l_1_node, 'name'))
+        yield '")\n    return {\n        # Add your state update logic here\n    }\n\n\n'
+    l_1_node = missing
+    def t_2(fiter):
+        for l_1_edge in fiter:
+            if t_1(environment.getattr(l_1_edge, 'condition')):
+                yield l_1_edge
+    for l_1_edge in t_2((undefined(name='edges') if l_0_edges is missing else l_0_edges)):
+        _loop_vars = {}
+        pass
+        yield 'def '
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '(state: SomeState) -> str:\n    print("In condition: '
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '")\n    raise NotImplementedError("Implement me.")\n\n\n'
+    l_1_edge = missing
+    yield 'agent = '
+    yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+    yield '(\n    state_schema=SomeState,\n    impl=[\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield '        ("'
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield '", '
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield '),\n'
+    l_1_node = missing
+    def t_3(fiter):
+        for l_1_edge in fiter:
+            if t_1(environment.getattr(l_1_edge, 'condition')):
+                yield l_1_edge
+    for l_1_edge in t_3((undefined(name='edges') if l_0_edges is missing else l_0_edges)):
+        _loop_vars = {}
+        pass
+        yield '        ("'
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '", '
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '),\n'
+    l_1_edge = missing
+    yield '    ],\n)\n\ncompiled_agent = agent.compile()\n\nprint(compiled_agent.invoke({"foo": "bar"}))\n'
+
+blocks = {}
+debug_info = '1=23&10=25&11=28&14=35&24=38&25=42&26=44&33=47&34=55&35=57&40=61&43=63&44=67&46=72&47=80'
@@ -0,0 +1,212 @@
+"""Pre-compiled `py-stub.j2` template.
+
+This is an automatically generated file. Do not modify it.
+To regenerate this file, run `scripts/freeze_templates.py`.
+"""
+
+CHECKSUM = "51352ed376633fbef98a6f8357a606221bba19b9"
+
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'py-stub.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_version = resolve('version')
+    l_0_stub_module = resolve('stub_module')
+    l_0_stub_name = resolve('stub_name')
+    l_0_nodes = resolve('nodes')
+    l_0_edges = resolve('edges')
+    l_0_entrypoint = resolve('entrypoint')
+    l_0_standard_edge = missing
+    try:
+        t_1 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    try:
+        t_2 = environment.tests['mapping']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'mapping' found.")
+    pass
+    yield '"""This is an automatically generated file. Do not modify it.\n\nThis file was generated using `langgraph-gen` version '
+    yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+    yield '.\nTo regenerate this file, run `langgraph-gen` with the source `yaml` file as an argument.\n\nUsage:\n\n1. Add the generated file to your project.\n2. Create a new agent using the stub.\n\nBelow is a sample implementation of the generated stub:\n\n```python\nfrom typing_extensions import TypedDict\n\n'
+    if (undefined(name='stub_module') if l_0_stub_module is missing else l_0_stub_module):
+        pass
+        yield 'from '
+        yield str((undefined(name='stub_module') if l_0_stub_module is missing else l_0_stub_module))
+        yield ' import '
+        yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+        yield '\n'
+    else:
+        pass
+        yield '# Update the import path\n# from [path to your stub] import '
+        yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+        yield '\n'
+    yield '\nclass SomeState(TypedDict):\n    # define your attributes here\n    foo: str\n\n# Define stand-alone functions\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield 'def '
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield '(state: SomeState) -> dict:\n    print("In node: '
+        yield str(environment.getattr(l_1_node, 'name'))
+        yield '")\n    return {\n        # Add your state update logic here\n    }\n\n\n'
+    l_1_node = missing
+    def t_3(fiter):
+        for l_1_edge in fiter:
+            if t_1(environment.getattr(l_1_edge, 'condition')):
+                yield l_1_edge
+    for l_1_edge in t_3((undefined(name='edges') if l_0_edges is missing else l_0_edges)):
+        _loop_vars = {}
+        pass
+        yield 'def '
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '(state: SomeState) -> str:\n    print("In condition: '
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '")\n    raise NotImplementedError("Implement me.")\n\n\n'
+    l_1_edge = missing
+    yield 'agent = '
+    yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+    yield '(\n    state_schema=SomeState,\n    impl=[\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield '        ("'
+        yield str(environment.getattr(l_1_node, 'name'))
+        yield '", '
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield '),\n'
+    l_1_node = missing
+    def t_4(fiter):
+        for l_1_edge in fiter:
+            if t_1(environment.getattr(l_1_edge, 'condition')):
+                yield l_1_edge
+    for l_1_edge in t_4((undefined(name='edges') if l_0_edges is missing else l_0_edges)):
+        _loop_vars = {}
+        pass
+        yield '        ("'
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '", '
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '),\n'
+    l_1_edge = missing
+    yield '    ]\n)\n\ncompiled_agent = agent.compile()\n\nprint(compiled_agent.invoke({"foo": "bar"}))\n"""\n'
+    def macro(l_1_edge):
+        t_5 = []
+        if l_1_edge is missing:
+            l_1_edge = undefined("parameter 'edge' was not provided", name='edge')
+        pass
+        if (l_1_edge == '__end__'):
+            pass
+            t_5.append(
+                'END',
+            )
+        elif (l_1_edge == '__start__'):
+            pass
+            t_5.append(
+                'START',
+            )
+        else:
+            pass
+            t_5.extend((
+                '"',
+                str(l_1_edge),
+                '"',
+            ))
+        return concat(t_5)
+    context.exported_vars.add('standard_edge')
+    context.vars['standard_edge'] = l_0_standard_edge = Macro(environment, macro, 'standard_edge', ('edge',), False, False, False, context.eval_ctx.autoescape)
+    yield '\nfrom typing import Callable, Any, Optional, Type\n\nfrom langgraph.constants import START, END  # noqa: F401\nfrom langgraph.graph import StateGraph\n\n\ndef '
+    yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+    yield '(\n    *,\n    state_schema: Optional[Type[Any]] = None,\n    config_schema: Optional[Type[Any]] = None,\n    input: Optional[Type[Any]] = None,\n    output: Optional[Type[Any]] = None,\n    impl: list[tuple[str, Callable]],\n) -> StateGraph:\n    """Create the state graph for '
+    yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+    yield '."""\n    # Declare the state graph\n    builder = StateGraph(\n        state_schema, config_schema=config_schema, input=input, output=output\n    )\n\n    nodes_by_name = {name: imp for name, imp in impl}\n\n    all_names = set(nodes_by_name)\n\n    expected_implementations = {\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield '        "'
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield '",\n'
+    l_1_node = missing
+    def t_6(fiter):
+        for l_1_edge in fiter:
+            if environment.getattr(l_1_edge, 'condition'):
+                yield l_1_edge
+    for l_1_edge in t_6((undefined(name='edges') if l_0_edges is missing else l_0_edges)):
+        _loop_vars = {}
+        pass
+        yield '        "'
+        yield str(environment.getattr(l_1_edge, 'condition'))
+        yield '",\n'
+    l_1_edge = missing
+    yield '    }\n\n    missing_nodes = expected_implementations - all_names\n    if missing_nodes:\n        raise ValueError(f"Missing implementations for: {missing_nodes}")\n\n    extra_nodes = all_names - expected_implementations\n\n    if extra_nodes:\n        raise ValueError(\n            f"Extra implementations for: {extra_nodes}. Please regenerate the stub."\n        )\n\n    # Add nodes\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield '    builder.add_node("'
+        yield str(environment.getattr(l_1_node, 'name'))
+        yield '", nodes_by_name["'
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield '"])\n'
+    l_1_node = missing
+    yield '\n    # Add edges\n'
+    for l_1_edge in (undefined(name='edges') if l_0_edges is missing else l_0_edges):
+        _loop_vars = {}
+        pass
+        if t_1(environment.getattr(l_1_edge, 'condition')):
+            pass
+            yield '    builder.add_conditional_edges(\n        '
+            yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), environment.getattr(l_1_edge, 'from'), _loop_vars=_loop_vars))
+            yield ',\n        nodes_by_name["'
+            yield str(environment.getattr(l_1_edge, 'condition'))
+            yield '"],\n'
+            if t_2(environment.getattr(l_1_edge, 'paths')):
+                pass
+                yield '        {\n'
+                for (l_2_key, l_2_value) in environment.call(context, environment.getattr(environment.getattr(l_1_edge, 'paths'), 'items'), _loop_vars=_loop_vars):
+                    _loop_vars = {}
+                    pass
+                    yield '            "'
+                    yield str(l_2_key)
+                    yield '": '
+                    yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), l_2_value, _loop_vars=_loop_vars))
+                    yield ',\n'
+                l_2_key = l_2_value = missing
+                yield '        }\n'
+            else:
+                pass
+                yield '        [\n'
+                for l_2_path in environment.getattr(l_1_edge, 'paths'):
+                    _loop_vars = {}
+                    pass
+                    yield '            '
+                    yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), l_2_path, _loop_vars=_loop_vars))
+                    yield ',\n'
+                l_2_path = missing
+                yield '        ],\n'
+            yield '    )\n'
+        else:
+            pass
+            yield '    builder.add_edge('
+            yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), environment.getattr(l_1_edge, 'from'), _loop_vars=_loop_vars))
+            yield ', '
+            yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), environment.getattr(l_1_edge, 'to'), _loop_vars=_loop_vars))
+            yield ')\n'
+    l_1_edge = missing
+    if (undefined(name='entrypoint') if l_0_entrypoint is missing else l_0_entrypoint):
+        pass
+        yield '    builder.set_entry_point("'
+        yield str((undefined(name='entrypoint') if l_0_entrypoint is missing else l_0_entrypoint))
+        yield '")\n'
+    yield '    return builder\n'
+
+blocks = {}
+debug_info = '3=31&16=33&17=36&20=43&28=46&29=50&30=52&37=55&38=63&39=65&44=69&47=71&48=75&50=80&51=88&60=94&61=99&70=120&78=122&89=124&90=128&92=131&93=139&109=143&110=147&114=153&115=156&117=159&118=161&119=163&121=166&122=170&127=179&128=183&134=191&137=196&138=199'
@@ -0,0 +1,179 @@
+"""Pre-compiled `ts-stub.j2` template.
+
+This is an automatically generated file. Do not modify it.
+To regenerate this file, run `scripts/freeze_templates.py`.
+"""
+
+CHECKSUM = "4287141ec3197a83302dced6ff8c5372b67febd4"
+
+from jinja2.runtime import LoopContext, Macro, Markup, Namespace, TemplateNotFound, TemplateReference, TemplateRuntimeError, Undefined, escape, identity, internalcode, markup_join, missing, str_join
+name = 'ts-stub.j2'
+
+def root(context, missing=missing):
+    resolve = context.resolve_or_missing
+    undefined = environment.undefined
+    concat = environment.concat
+    cond_expr_undefined = Undefined
+    if 0: yield None
+    l_0_version = resolve('version')
+    l_0_stub_module = resolve('stub_module')
+    l_0_stub_name = resolve('stub_name')
+    l_0_nodes = resolve('nodes')
+    l_0_edges = resolve('edges')
+    l_0_entrypoint = resolve('entrypoint')
+    l_0_standard_edge = missing
+    try:
+        t_1 = environment.tests['defined']
+    except KeyError:
+        @internalcode
+        def t_1(*unused):
+            raise TemplateRuntimeError("No test named 'defined' found.")
+    try:
+        t_2 = environment.tests['mapping']
+    except KeyError:
+        @internalcode
+        def t_2(*unused):
+            raise TemplateRuntimeError("No test named 'mapping' found.")
+    pass
+    yield '/* This is an automatically generated file. Do not modify it.\n\nThis file was generated using `langgraph-gen` version '
+    yield str((undefined(name='version') if l_0_version is missing else l_0_version))
+    yield '.\nTo regenerate this file, run `langgraph-gen` with the source `YAML` file as an argument.\n\nUsage:\n\n1. Add the generated file to your project.\n2. Create a new agent using the stub.\n\n```typescript\n'
+    def macro(l_1_edge):
+        t_3 = []
+        if l_1_edge is missing:
+            l_1_edge = undefined("parameter 'edge' was not provided", name='edge')
+        pass
+        if (l_1_edge == '__end__'):
+            pass
+            t_3.append(
+                'END',
+            )
+        elif (l_1_edge == '__start__'):
+            pass
+            t_3.append(
+                'START',
+            )
+        else:
+            pass
+            t_3.extend((
+                '"',
+                str(l_1_edge),
+                '"',
+            ))
+        return concat(t_3)
+    context.exported_vars.add('standard_edge')
+    context.vars['standard_edge'] = l_0_standard_edge = Macro(environment, macro, 'standard_edge', ('edge',), False, False, False, context.eval_ctx.autoescape)
+    if (undefined(name='stub_module') if l_0_stub_module is missing else l_0_stub_module):
+        pass
+        yield 'import { '
+        yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+        yield ' } from "'
+        yield str((undefined(name='stub_module') if l_0_stub_module is missing else l_0_stub_module))
+        yield '"\n'
+    else:
+        pass
+        yield 'import { '
+        yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+        yield ' } from "[some_path]";\n'
+    yield '\n\nconst StateAnnotation = Annotation.Root({\n    // Define your state properties here\n    foo: Annotation<string>(),\n});\n\nconst agent = CustomAgentStub(Annotation.Root({ foo: Annotation<string>() }), {\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield '    '
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield ': (state) => console.log("In node: '
+        yield str(environment.getattr(l_1_node, 'name'))
+        yield '"),\n'
+    l_1_node = missing
+    for l_1_edge in (undefined(name='edges') if l_0_edges is missing else l_0_edges):
+        _loop_vars = {}
+        pass
+        if t_1(environment.getattr(l_1_edge, 'condition')):
+            pass
+            yield '    '
+            yield str(environment.getattr(l_1_edge, 'condition'))
+            yield ': (state) => {\n        console.log("In condition: '
+            yield str(environment.getattr(l_1_edge, 'condition'))
+            yield '");\n        throw new Error("Implement me. Returns one of the paths.");\n    },\n'
+    l_1_edge = missing
+    yield '});\n\nconst compiled_agent = agent.compile();\nconsole.log(await compiled_agent.invoke({ foo: "bar" }));\n```\n\n*/\nimport {\n    StateGraph,\n    START,\n    END,\n    type AnnotationRoot,\n} from "@langchain/langgraph";\n\ntype AnyAnnotationRoot = AnnotationRoot<any>;\n\nexport function '
+    yield str((undefined(name='stub_name') if l_0_stub_name is missing else l_0_stub_name))
+    yield '<TAnnotation extends AnyAnnotationRoot>(\n  stateAnnotation: TAnnotation,\n  impl: {\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield '    '
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield ': (state: TAnnotation["State"]) => TAnnotation["Update"],\n'
+    l_1_node = missing
+    for l_1_edge in (undefined(name='edges') if l_0_edges is missing else l_0_edges):
+        _loop_vars = {}
+        pass
+        if t_1(environment.getattr(l_1_edge, 'condition')):
+            pass
+            yield '    '
+            yield str(environment.getattr(l_1_edge, 'condition'))
+            yield ': (state: TAnnotation["State"]) => string,\n'
+    l_1_edge = missing
+    yield '  }\n) {\n  return new StateGraph(stateAnnotation)\n'
+    for l_1_node in (undefined(name='nodes') if l_0_nodes is missing else l_0_nodes):
+        _loop_vars = {}
+        pass
+        yield '    .addNode("'
+        yield str(environment.getattr(l_1_node, 'name'))
+        yield '", impl.'
+        yield str(environment.getattr(l_1_node, 'id'))
+        yield ')\n'
+    l_1_node = missing
+    if (undefined(name='entrypoint') if l_0_entrypoint is missing else l_0_entrypoint):
+        pass
+        yield '    .addEdge(START, "'
+        yield str((undefined(name='entrypoint') if l_0_entrypoint is missing else l_0_entrypoint))
+        yield '")\n'
+    for l_1_edge in (undefined(name='edges') if l_0_edges is missing else l_0_edges):
+        _loop_vars = {}
+        pass
+        if t_1(environment.getattr(l_1_edge, 'condition')):
+            pass
+            yield '    .addConditionalEdges(\n        '
+            yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), environment.getattr(l_1_edge, 'from'), _loop_vars=_loop_vars))
+            yield ',\n        impl.'
+            yield str(environment.getattr(l_1_edge, 'condition'))
+            yield ',\n'
+            if t_2(environment.getattr(l_1_edge, 'paths')):
+                pass
+                yield '        {\n'
+                for (l_2_key, l_2_value) in environment.call(context, environment.getattr(environment.getattr(l_1_edge, 'paths'), 'items'), _loop_vars=_loop_vars):
+                    _loop_vars = {}
+                    pass
+                    yield '            '
+                    yield str(l_2_key)
+                    yield ': '
+                    yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), l_2_value, _loop_vars=_loop_vars))
+                    yield ',\n'
+                l_2_key = l_2_value = missing
+                yield '        }\n'
+            else:
+                pass
+                yield '        [\n'
+                for l_2_path in environment.getattr(l_1_edge, 'paths'):
+                    _loop_vars = {}
+                    pass
+                    yield '            '
+                    yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), l_2_path, _loop_vars=_loop_vars))
+                    yield ',\n'
+                l_2_path = missing
+                yield '        ]\n'
+            yield '    )\n'
+        else:
+            pass
+            yield '    .addEdge('
+            yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), environment.getattr(l_1_edge, 'from'), _loop_vars=_loop_vars))
+            yield ', '
+            yield str(environment.call(context, (undefined(name='standard_edge') if l_0_standard_edge is missing else l_0_standard_edge), environment.getattr(l_1_edge, 'to'), _loop_vars=_loop_vars))
+            yield ')\n'
+    l_1_edge = missing
+    yield '}'
+
+blocks = {}
+debug_info = '3=31&12=33&13=38&15=58&16=61&18=68&28=71&29=75&31=80&32=83&33=86&34=88&55=92&58=94&59=98&61=101&62=104&63=107&69=111&70=115&72=120&73=123&75=125&76=128&78=131&79=133&80=135&82=138&83=142&88=151&89=155&95=163'
@@ -0,0 +1,75 @@
+"""Minimal command line parser for the common `langgraph-gen` invocations.
+
+Building an `argparse` parser is comparatively expensive for a CLI this small,
+so well-formed command lines are parsed here. Anything else (help, version,
+abbreviated or unknown options, errors, ...) is left to the `argparse` parser
+in `langgraph_gen.cli`, which produces the usual messages.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+# Not imported from `typing`, which is slow to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, Sequence
+
+# Option strings mapped to the destination they set
+OPTIONS = {
+    "-l": "language",
+    "--language": "language",
+    "-o": "output",
+    "--output": "output",
+    "--implementation": "implementation",
+}
+
+
+def parse(argv: Sequence[str]) -> Optional[SimpleNamespace]:
+    """Parse the command line arguments.
+
+    Args:
+        argv: Command line arguments, without the program name
+
+    Returns:
+        Parsed arguments with the same attributes as the `argparse` parser, or
+        None if the arguments must be handled by the `argparse` parser instead.
+    """
+    values: dict[str, Optional[str]] = {
+        "input": None,
+        "language": "python",
+        "output": None,
+        "implementation": None,
+    }
+    args = iter(argv)
+    for arg in args:
+        if arg.startswith("-") and arg != "-":
+            if arg.startswith("--") and "=" in arg:
+                option, value = arg.split("=", 1)
+            elif arg[:2] in ("-l", "-o") and len(arg) > 2 and arg[2] != "=":
+                # Attached short option value, e.g. `-lpython`
+                option, value = arg[:2], arg[2:]
+            else:
+                option, value = arg, next(args, None)
+                if value is None or value.startswith("-"):
+                    return None
+            if option not in OPTIONS:
+                return None
+            values[OPTIONS[option]] = value
+        elif values["input"] is None:
+            values["input"] = arg
+        else:
+            return None
+
+    if values["input"] is None:
+        return None
+
+    return SimpleNamespace(
+        input=Path(values["input"]),
+        language=values["language"],
+        output=None if values["output"] is None else Path(values["output"]),
+        implementation=(
+            None if values["implementation"] is None else Path(values["implementation"])
+        ),
+    )
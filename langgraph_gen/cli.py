@@ -1,31 +1,109 @@
 """Entrypoint script."""
 
-import argparse
+from __future__ import annotations
+
+import contextlib
+import os
+import stat
 import sys
 from pathlib import Path
-from typing import Optional, Literal
+from types import SimpleNamespace
+
+from langgraph_gen._fastargs import parse
+
+# Not imported from `typing`, which is slow to import
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Literal, Optional
+
+    from jinja2.environment import TemplateStream
+
+# Languages code can be generated for
+LANGUAGES = ("python", "typescript")
+
+# ANSI escape sequences used to decorate terminal output
+_RED = "\033[91m"
+_GREEN = "\033[32m"
+_RESET = "\033[0m"
 
-from langgraph_gen._version import __version__
-from langgraph_gen.generate import generate_from_spec
+# Header and labels of the success message, for terminals and for plain output
+_SUCCESS_TTY = (
+    f"{_GREEN}✅ Successfully generated files:{_RESET}",
+    f"{_GREEN}📄 Stub file:          {_RESET} ",
+    f"{_GREEN}🔧 Implementation file: {_RESET} ",
+)
+_SUCCESS_PLAIN = (
+    "Successfully generated files:",
+    "- Stub file:           ",
+    "- Implementation file: ",
+)
 
 
-def print_error(message: str) -> None:
+def print_error(message: str, *, color: Optional[bool] = None) -> None:
     """Print error messages with visual emphasis.
 
     Args:
         message: The error message to display
+        color: Whether to use colors. Defaults to whether stderr is a terminal.
     """
-    if sys.stderr.isatty():
+    if color is None:
+        color = sys.stderr.isatty()
+    if color:
         # Use colors for terminal output
-        sys.stderr.write(f"\033[91mError: {message}\033[0m\n")
+        sys.stderr.write(f"{_RED}Error: {message}{_RESET}\n")
     else:
         # Plain text for non-terminal output
         sys.stderr.write(f"Error: {message}\n")
 
 
-def _rewrite_path_as_import(path: Path) -> str:
-    """Rewrite a path as an import statement."""
-    return ".".join(path.with_suffix("").parts)
+def _rewrite_path_as_import(path: str) -> str:
+    """Rewrite a relative path as an import statement."""
+    return os.path.splitext(path)[0].replace(os.sep, ".")
+
+
+def _error_for_path(path: Path, error: OSError) -> OSError:
+    """Re-create an OS error so that it names `path` instead of a temporary file."""
+    return type(error)(error.errno, error.strerror, os.fspath(path))
+
+
+def _write_streams(outputs: list[tuple[TemplateStream, Path]]) -> None:
+    """Render streams of generated code into files.
+
+    The code is rendered into temporary files next to the targets, which only
+    replace the targets once everything rendered, so a failure while rendering
+    leaves existing files untouched.
+
+    Since files are replaced rather than rewritten, writing them needs write
+    access to their directory. Regenerated files keep their permissions, but
+    not their owner, and hard links to them are broken.
+
+    Args:
+        outputs: Pairs of a stream of code and the file to write it to
+    """
+    rendered = []
+    try:
+        for index, (stream, path) in enumerate(outputs):
+            target = os.path.realpath(path)
+            temporary = f"{target}.{os.getpid()}.{index}.tmp"
+            try:
+                fd = os.open(temporary, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+                rendered.append((temporary, target, path))
+                with open(fd, "wb") as f:
+                    stream.dump(f, encoding="utf-8")
+            except OSError as e:
+                raise _error_for_path(path, e) from e
+            # Keep the permissions of files being regenerated
+            with contextlib.suppress(FileNotFoundError):
+                os.chmod(temporary, stat.S_IMODE(os.stat(target).st_mode))
+        for temporary, target, path in rendered:
+            try:
+                os.replace(temporary, target)
+            except OSError as e:
+                raise _error_for_path(path, e) from e
+    finally:
+        for temporary, _, _ in rendered:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(temporary)
 
 
 def _generate(
@@ -34,7 +112,7 @@ def _generate(
     language: Literal["python", "typescript"],
     output_file: Optional[Path] = None,
     implementation: Optional[Path] = None,
-) -> tuple[str, str]:
+) -> tuple[Path, Path]:
     """Generate agent code from a YAML specification file.
 
     Args:
@@ -46,7 +124,10 @@ def _generate(
     Returns:
         2-tuple of path: Path to the generated stub file and implementation file
     """
-    if language not in ["python", "typescript"]:
+    # Imported lazily so that `--help` / `--version` don't pay for jinja2 & yaml
+    from langgraph_gen.generate import stream_from_spec
+
+    if language not in LANGUAGES:
         raise NotImplementedError(
             f"Unsupported language: {language}. Use one of 'python' or 'typescript'"
         )
@@ -58,27 +139,59 @@ def _generate(
         implementation = input_file.with_name(f"{input_file.stem}_impl{suffix}")
 
     # Get the implementation relative to the output path
-    stub_module = _rewrite_path_as_import(
-        output_path.relative_to(implementation.parent)
-    )
+    relative_stub = os.path.relpath(output_path, implementation.parent)
+    if relative_stub.startswith(os.pardir + os.sep):
+        raise ValueError(
+            f"{output_path} is not in the subpath of {implementation.parent}"
+        )
+    stub_module = _rewrite_path_as_import(relative_stub)
 
-    spec_as_yaml = input_file.read_text()
-    stub, impl = generate_from_spec(
+    # The spec is passed on as raw bytes; the YAML parser handles decoding
+    spec_as_yaml = input_file.read_bytes()
+    stub, impl = stream_from_spec(
         spec_as_yaml,
         "yaml",
         templates=["stub", "implementation"],
         language=language,
         stub_module=stub_module,
+        fast_yaml=True,
     )
-    output_path.write_text(stub)
-    implementation.write_text(impl)
+    _write_streams([(stub, output_path), (impl, implementation)])
 
     # Return the created files for reporting
     return output_path, implementation
 
 
-def main() -> None:
-    """Langgraph-gen CLI entry point."""
+def _parse_args(*, stderr_tty: bool) -> SimpleNamespace:
+    """Parse the command line with argparse.
+
+    This handles `--help`, `--version` and malformed command lines, which the
+    fast parser in `langgraph_gen._fastargs` leaves to argparse.
+
+    Args:
+        stderr_tty: Whether stderr is a terminal, to color error messages
+    """
+    import argparse
+
+    class VersionAction(argparse.Action):
+        """Print the version and exit, importing the version only when requested."""
+
+        def __init__(self, option_strings: list[str], dest: str, **kwargs) -> None:
+            super().__init__(
+                option_strings,
+                dest,
+                nargs=0,
+                default=argparse.SUPPRESS,
+                help="show program's version number and exit",
+                **kwargs,
+            )
+
+        def __call__(self, parser, namespace, values, option_string=None) -> None:
+            from langgraph_gen._version import __version__
+
+            sys.stdout.write(f"{parser.prog} {__version__}\n")
+            parser.exit()
+
     # Define examples text separately with proper formatting
     examples = """
 Examples:
@@ -121,9 +234,7 @@ Examples:
         default=None,
     )
 
-    parser.add_argument(
-        "-V", "--version", action="version", version=f"%(prog)s {__version__}"
-    )
+    parser.add_argument("-V", "--version", action=VersionAction)
 
     # Custom error handling for argparse
     try:
@@ -149,12 +260,33 @@ Examples:
             custom_help_parser.print_help()
 
             # Add error message using our helper function
-            print_error("Invalid arguments")
+            print_error("Invalid arguments", color=stderr_tty)
         sys.exit(e.code)
 
+    return SimpleNamespace(**vars(args))
+
+
+def main() -> None:
+    """Langgraph-gen CLI entry point."""
+    # Fast path: answer `--version` without building the argument parser
+    if len(sys.argv) == 2 and sys.argv[1] in ("-V", "--version"):
+        from langgraph_gen._version import __version__
+
+        sys.stdout.write(f"langgraph-gen {__version__}\n")
+        return
+
+    # Check once whether output goes to a terminal to use colors and emoji
+    stdout_tty = sys.stdout.isatty()
+    stderr_tty = sys.stderr.isatty()
+
+    args = parse(sys.argv[1:])
+    if args is None:
+        # Help, version, unusual or invalid command lines
+        args = _parse_args(stderr_tty=stderr_tty)
+
     # Check if input file exists
     if not args.input.exists():
-        print_error(f"Input file {args.input} does not exist")
+        print_error(f"Input file {args.input} does not exist", color=stderr_tty)
         sys.exit(1)
 
     # Generate the code
@@ -166,18 +298,20 @@ Examples:
             implementation=args.implementation,
         )
 
-        # Check if stdout is a TTY to use colors and emoji
-        if sys.stdout.isatty():
-            print("\033[32m✅ Successfully generated files:\033[0m")
-            print(f"\033[32m📄 Stub file:          \033[0m {stub_file}")
-            print(f"\033[32m🔧 Implementation file: \033[0m {impl_file}")
-        else:
-            print("Successfully generated files:")
-            print(f"- Stub file:           {stub_file}")
-            print(f"- Implementation file: {impl_file}")
+        header, stub_label, impl_label = _SUCCESS_TTY if stdout_tty else _SUCCESS_PLAIN
+        # Emit the whole message with a single write
+        sys.stdout.write(
+            "".join(
+                [
+                    f"{header}\n",
+                    f"{stub_label}{stub_file}\n",
+                    f"{impl_label}{impl_file}\n",
+                ]
+            )
+        )
     except Exception as e:
         # Use our helper function for consistent error formatting
-        print_error(str(e))
+        print_error(str(e), color=stderr_tty)
         sys.exit(1)
 
 
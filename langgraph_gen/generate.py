@@ -1,13 +1,22 @@
 #!/usr/bin/env python3
 """LangGraph Agent Code Generator CLI"""
 
+import codecs
+import contextlib
+import functools
+import hashlib
+import importlib
 import json
+import math
+import os
 import re
+import threading
 from pathlib import Path
-from typing import Any, Callable, Literal, Set, Optional
+from typing import Any, Callable, Iterator, Literal, Set, Optional, Union
 
 import jinja2
-import yaml
+from jinja2.bccache import Bucket, FileSystemBytecodeCache
+from jinja2.environment import TemplateStream
 from jinja2.sandbox import SandboxedEnvironment
 from langgraph.graph import StateGraph, START, END
 
@@ -32,11 +41,349 @@ PY_IMPL = _load_template("py-stub-impl.j2")
 TS_STUB = _load_template("ts-stub.j2")
 TS_IMPL = _load_template("ts-stub-impl.j2")
 
+TEMPLATES = {
+    "py-stub.j2": PY_STUB,
+    "py-stub-impl.j2": PY_IMPL,
+    "ts-stub.j2": TS_STUB,
+    "ts-stub-impl.j2": TS_IMPL,
+}
+
+
+class _BytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache that never fails template rendering.
+
+    Only used when a template is compiled from source instead of being loaded
+    from its emitter. Failing to write the cache (read-only or full disk, ...)
+    should not be fatal.
+    """
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def _get_environment() -> SandboxedEnvironment:
+    """Get the shared jinja2 environment, creating it on first use.
+
+    Sharing the environment lets repeated calls reuse loaded templates.
+    """
+    return SandboxedEnvironment(
+        loader=jinja2.DictLoader(TEMPLATES),
+        trim_blocks=True,
+        lstrip_blocks=True,
+    )
+
+
+def _compile_template(name: str) -> jinja2.Template:
+    """Compile a template from its source.
+
+    Templates are normally loaded from their pre-compiled emitter modules, so
+    this only runs when an emitter is missing or stale (e.g. with a jinja2
+    version other than the one the emitters were frozen with). In that case a
+    bytecode cache is enabled so that later processes can skip compiling.
+    """
+    env = _get_environment()
+    if env.bytecode_cache is None:
+        try:
+            env.bytecode_cache = _BytecodeCache()
+        except RuntimeError:
+            # No usable (per-user) temporary directory
+            pass
+    return env.get_template(name)
+
+
+# Modules in `langgraph_gen._emitters` holding pre-compiled versions of the
+# templates. These are generated by `scripts/freeze_templates.py`.
+EMITTERS = {
+    "py-stub.j2": "python_stub",
+    "py-stub-impl.j2": "python_implementation",
+    "ts-stub.j2": "typescript_stub",
+    "ts-stub-impl.j2": "typescript_implementation",
+}
+
+
+def _template_checksum(name: str) -> str:
+    """Get the checksum used to detect stale emitters.
+
+    Covers the template source and the jinja2 version, since the compiled
+    code relies on jinja2's runtime.
+    """
+    jinja_version = getattr(jinja2, "__version__", "")
+    data = f"{jinja_version}\n{TEMPLATES[name]}"
+    return hashlib.sha1(data.encode("utf-8")).hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_template(name: str) -> jinja2.Template:
+    """Get a template, preferring its pre-compiled emitter module.
+
+    Falls back to compiling the template source if the emitter is missing or
+    was generated from a different version of the template.
+    """
+    env = _get_environment()
+    try:
+        emitter = importlib.import_module(f"langgraph_gen._emitters.{EMITTERS[name]}")
+    except ImportError:
+        return _compile_template(name)
+    if emitter.CHECKSUM != _template_checksum(name):
+        return _compile_template(name)
+    return env.template_class.from_module_dict(
+        env, vars(emitter), env.make_globals(None)
+    )
+
 
 class InvalidSpec(Exception):
     """Invalid spec."""
 
 
+try:
+    import ryml
+except ImportError:  # pragma: no cover
+    ryml = None
+
+
+class _UnsupportedYaml(Exception):
+    """Raised when the fast YAML path cannot faithfully load a document."""
+
+
+# Plain scalars that PyYAML's safe loader resolves to non-string values.
+# The regular expressions are copied from PyYAML's (YAML 1.1) resolver.
+_YAML_NULLS = {"", "~", "null", "Null", "NULL"}
+_YAML_BOOLS = {
+    **dict.fromkeys(("yes", "Yes", "YES", "true", "True", "TRUE"), True),
+    **dict.fromkeys(("on", "On", "ON"), True),
+    **dict.fromkeys(("no", "No", "NO", "false", "False", "FALSE"), False),
+    **dict.fromkeys(("off", "Off", "OFF"), False),
+}
+# Merge keys, the `value` type and bare indicators, which PyYAML resolves to
+# special tags.
+_YAML_SPECIAL = {"<<", "=", "!", "&", "*"}
+_YAML_DECIMAL_INT = re.compile(r"[-+]?(?:0|[1-9][0-9_]*)")
+_YAML_INT = re.compile(
+    r"""[-+]?0b[0-1_]+
+    |[-+]?0[0-7_]+
+    |[-+]?(?:0|[1-9][0-9_]*)
+    |[-+]?0x[0-9a-fA-F_]+
+    |[-+]?[1-9][0-9_]*(?::[0-5]?[0-9])+""",
+    re.X,
+)
+_YAML_FLOAT = re.compile(
+    r"""[-+]?(?:[0-9][0-9_]*)\.[0-9_]*(?:[eE][-+][0-9]+)?
+    |\.[0-9][0-9_]*(?:[eE][-+][0-9]+)?
+    |[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\.[0-9_]*
+    |[-+]?\.(?:inf|Inf|INF)
+    |\.(?:nan|NaN|NAN)""",
+    re.X,
+)
+_YAML_TIMESTAMP = re.compile(
+    r"""[0-9][0-9][0-9][0-9]-[0-9][0-9]-[0-9][0-9]
+    |[0-9][0-9][0-9][0-9] -[0-9][0-9]? -[0-9][0-9]?
+    (?:[Tt]|[ \t]+)[0-9][0-9]?
+    :[0-9][0-9] :[0-9][0-9] (?:\.[0-9]*)?
+    (?:[ \t]*(?:Z|[-+][0-9][0-9]?(?::[0-9][0-9])?))?""",
+    re.X,
+)
+# Documents that rapidyaml reads but PyYAML rejects or reads differently: tabs,
+# control and other non-printable characters, lone carriage returns, the
+# NEL/LS/PS line breaks of YAML 1.1, byte order marks past the start of the
+# document, directives, document end markers, explicit keys and block scalar
+# headers followed by anything but a comment (e.g. `a: |1x`; this also matches
+# `x > y`).
+_YAML_DEFERRED = re.compile(
+    rb"""[\x00-\x09\x0b\x0c\x0e-\x1f\x7f]
+    |\r(?!\n)
+    |\xc2[\x80-\x9f]
+    |\xe2\x80[\xa8\xa9]
+    |\xef\xbf[\xbe\xbf]
+    |(?s:.)\xef\xbb\xbf
+    |^(?:\xef\xbb\xbf)?(?:%|\ *\.\.\.)
+    |^(?:\xef\xbb\xbf)?[-\ ]*\?(?:\ |\r?$)
+    |(?:^|\ )[|>](?![-+0-9]*\ *(?:\#|\r?$))""",
+    re.M | re.X,
+)
+# Indicators that PyYAML doesn't accept at the start of a plain scalar (or, for
+# `?` and `:`, reads as keys and values in flow collections), unlike rapidyaml
+# (e.g. `a: @x`).
+_YAML_INDICATORS = frozenset(",[]{}#&*!|>'\"%@`?:")
+
+# The ryml tree is reused so that the parse arena is only grown once. The lock
+# guards both the tree and the stderr redirection in `_silence_native_stderr`.
+_ryml_lock = threading.Lock()
+_ryml_tree: Any = None
+
+
+def _resolve_plain_scalar(value: str) -> Any:
+    """Resolve a plain (unquoted) YAML scalar the way PyYAML's safe loader does."""
+    if value in _YAML_NULLS:
+        return None
+    if value in _YAML_BOOLS:
+        return _YAML_BOOLS[value]
+    if value in _YAML_SPECIAL or value[0] in _YAML_INDICATORS:
+        raise _UnsupportedYaml(value)
+    if value[0] in " \n" or value[-1] in " \n":
+        # PyYAML strips these, rapidyaml keeps some (e.g. `{k: v\n\n}`)
+        raise _UnsupportedYaml(value)
+    if value[0] not in "0123456789+-.":
+        return value
+    if _YAML_FLOAT.fullmatch(value):
+        if ":" in value:
+            # Sexagesimal
+            raise _UnsupportedYaml(value)
+        number = value.replace("_", "").lower()
+        sign = -1.0 if number[0] == "-" else 1.0
+        number = number.lstrip("+-")
+        if number == ".inf":
+            return sign * math.inf
+        if number == ".nan":
+            return math.nan
+        return sign * float(number)
+    if _YAML_DECIMAL_INT.fullmatch(value):
+        return int(value.replace("_", ""))
+    if _YAML_INT.fullmatch(value) or _YAML_TIMESTAMP.fullmatch(value):
+        # Binary, octal, hex and sexagesimal integers and timestamps
+        raise _UnsupportedYaml(value)
+    return value
+
+
+def _ryml_scalar(raw: Optional[memoryview], quoted: bool) -> Any:
+    """Convert a ryml scalar into a python object."""
+    if raw is None:
+        return None
+    value = bytes(raw).decode("utf-8")
+    if quoted:
+        return value
+    return _resolve_plain_scalar(value)
+
+
+def _ryml_to_python(tree: Any, node: int) -> Any:
+    """Build plain dicts/lists/scalars from a ryml tree, starting at `node`."""
+    if tree.has_val_anchor(node) or tree.is_val_ref(node) or tree.has_val_tag(node):
+        raise _UnsupportedYaml("anchors, aliases and tags")
+    if tree.is_map(node):
+        result = {}
+        child = tree.first_child(node)
+        while child != ryml.NONE:
+            if (
+                tree.has_key_anchor(child)
+                or tree.is_key_ref(child)
+                or tree.has_key_tag(child)
+            ):
+                raise _UnsupportedYaml("anchors, aliases and tags")
+            raw_key = tree.key(child)
+            key_quoted = tree.is_key_quoted(child)
+            if raw_key is None and not key_quoted:
+                # PyYAML rejects empty keys (`: x`)
+                raise _UnsupportedYaml("empty keys")
+            key = _ryml_scalar(raw_key, key_quoted)
+            result[key] = _ryml_to_python(tree, child)
+            child = tree.next_sibling(child)
+        return result
+    if tree.is_seq(node):
+        result = []
+        child = tree.first_child(node)
+        while child != ryml.NONE:
+            result.append(_ryml_to_python(tree, child))
+            child = tree.next_sibling(child)
+        return result
+    if tree.has_val(node):
+        return _ryml_scalar(tree.val(node), tree.is_val_quoted(node))
+    # Empty document
+    return None
+
+
+@contextlib.contextmanager
+def _silence_native_stderr() -> Iterator[None]:
+    """Discard anything written to the stderr file descriptor.
+
+    rapidyaml's C++ error handler prints diagnostics straight to file
+    descriptor 2 before raising, and its python bindings have no hook to turn
+    that off. Failed parses are retried with PyYAML, which reports the error.
+
+    The descriptor is shared by the whole process, so this is only done when the
+    caller owns the process (see `_load_yaml`). Must be called with `_ryml_lock`
+    held.
+    """
+    try:
+        saved = os.dup(2)
+    except OSError:
+        # No stderr to silence (e.g. pythonw)
+        yield
+        return
+    try:
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        try:
+            os.dup2(devnull, 2)
+        finally:
+            os.close(devnull)
+        yield
+    finally:
+        os.dup2(saved, 2)
+        os.close(saved)
+
+
+def _load_yaml_with_ryml(spec: Union[str, bytes]) -> Any:
+    """Load a YAML document using rapidyaml."""
+    global _ryml_tree
+
+    if isinstance(spec, str):
+        spec = spec.encode("utf-8")
+    elif spec.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        # rapidyaml only reads UTF-8
+        raise _UnsupportedYaml("UTF-16 documents")
+    if _YAML_DEFERRED.search(spec):
+        raise _UnsupportedYaml("special characters or document end markers")
+    if not spec.endswith((b"\n", b"\r")) and (b"|" in spec or b">" in spec):
+        # rapidyaml adds a line break to a block scalar that ends the document
+        raise _UnsupportedYaml("block scalars without a final line break")
+    with _ryml_lock:
+        if _ryml_tree is None:
+            _ryml_tree = ryml.Tree()
+        else:
+            _ryml_tree.clear()
+            _ryml_tree.clear_arena()
+        with _silence_native_stderr():
+            ryml.parse_in_arena(spec, tree=_ryml_tree)
+        root = _ryml_tree.root_id()
+        if _ryml_tree.is_stream(root):
+            # Multi-document streams are rejected by PyYAML's safe_load
+            raise _UnsupportedYaml("document streams")
+        if not _ryml_tree.is_container(root):
+            # Never a valid spec, and rapidyaml reads some top level block
+            # scalars differently
+            raise _UnsupportedYaml("top level scalars")
+        return _ryml_to_python(_ryml_tree, root)
+
+
+def _load_yaml(spec: Union[str, bytes], *, fast: bool = False) -> Any:
+    """Load a YAML document.
+
+    Args:
+        spec: YAML document
+        fast: Use rapidyaml when it is installed. Documents that the fast path
+            doesn't handle (anchors, tags, non-decimal numbers, parse errors,
+            ...) are still loaded with PyYAML. rapidyaml's diagnostics are
+            silenced by redirecting the process-wide stderr file descriptor, so
+            this is only enabled by the CLI, never for library callers.
+
+    Documents that PyYAML's safe loader accepts load to the same objects either
+    way. rapidyaml is more lenient with some malformed flow collections, which
+    load instead of raising an error (e.g. `a: [b?c]`).
+    """
+    if fast and ryml is not None:
+        try:
+            return _load_yaml_with_ryml(spec)
+        except (_UnsupportedYaml, ryml.ExceptionParse, UnicodeDecodeError):
+            # Let PyYAML handle (or report errors for) anything unusual
+            pass
+
+    import yaml
+
+    return yaml.safe_load(spec)
+
+
 def _validate_spec(spec: Any) -> None:
     """Raise an error if the spec is invalid."""
     if not isinstance(spec, dict):
@@ -68,30 +415,16 @@ def _update_spec(spec: dict) -> None:
         node["id"] = PATTERN.sub("_", node["name"])
 
 
-def generate_from_spec(
-    spec_str: str,
+def _parse_spec(
+    spec_str: Union[str, bytes],
     format_: Literal["yaml", "json"],
-    templates: list[Literal["stub", "implementation"]],
     *,
-    language: Literal["python", "typescript"] = "python",
-    stub_module: Optional[str] = None,
-) -> list[str]:
-    """Generate agent code from a YAML specification file.
-
-    Args:
-        spec_str: Specification encoded as a string
-        format_: Format of the specification
-        templates: Sequence of templates to generate
-        language: Language to generate code for
-        stub_module If known, the module name to import the stub from.
-            This will be known in the CLI.
-
-    Returns:
-        list[str]: List of generated code files, in the same order as the templates.
-    """
+    fast_yaml: bool = False,
+) -> dict:
+    """Parse and validate a specification, adding machine names to the nodes."""
     if format_ == "yaml":
         try:
-            spec = yaml.safe_load(spec_str)
+            spec = _load_yaml(spec_str, fast=fast_yaml)
         except Exception:
             raise InvalidSpec("Invalid YAML spec.")
     elif format_ == "json":
@@ -105,51 +438,96 @@ def generate_from_spec(
     _validate_spec(spec)
     # Add machine names to the nodes
     _update_spec(spec)
+    return spec
 
-    env = SandboxedEnvironment(
-        loader=jinja2.BaseLoader, trim_blocks=True, lstrip_blocks=True
-    )
 
-    generated = []
+def _select_templates(
+    spec: dict,
+    templates: list[Literal["stub", "implementation"]],
+    *,
+    language: Literal["python", "typescript"],
+    stub_module: Optional[str],
+) -> list[tuple[jinja2.Template, dict[str, Any]]]:
+    """Get the template and the context to render it with, for each template."""
+    selected = []
 
     for template_name in templates:
         try:
             if template_name == "stub":
                 if language == "python":
-                    template = env.from_string(PY_STUB)
+                    template = _get_template("py-stub.j2")
                 elif language == "typescript":
-                    template = env.from_string(TS_STUB)
+                    template = _get_template("ts-stub.j2")
                 else:
                     raise ValueError(f"Invalid language: {language}")
             elif template_name == "implementation":
                 if language == "python":
-                    template = env.from_string(PY_IMPL)
+                    template = _get_template("py-stub-impl.j2")
                 elif language == "typescript":
-                    template = env.from_string(TS_IMPL)
+                    template = _get_template("ts-stub-impl.j2")
                 else:
                     raise ValueError(f"Invalid language: {language}")
             else:
                 raise ValueError(f"Invalid template type: {template_name}")
-            # Update the name based on the language
+        except jinja2.TemplateError as e:
+            raise AssertionError(
+                f"Error rendering template: {str(e)}",
+            )
+        # Update the name based on the language
 
-            if "name" not in spec:
-                if language == "python":
-                    stub_name = "create_agent"
-                elif language == "typescript":
-                    stub_name = "createAgent"
-                else:
-                    raise ValueError(f"Invalid language: {language}")
+        if "name" not in spec:
+            if language == "python":
+                stub_name = "create_agent"
+            elif language == "typescript":
+                stub_name = "createAgent"
             else:
-                stub_name = spec["name"]
-
-            code = template.render(
-                stub_name=stub_name,
-                nodes=spec["nodes"],
-                edges=spec["edges"],
-                entrypoint=spec.get("entrypoint", None),
-                version=__version__,
-                stub_module=stub_module,
-            )
+                raise ValueError(f"Invalid language: {language}")
+        else:
+            stub_name = spec["name"]
+
+        context = {
+            "stub_name": stub_name,
+            "nodes": spec["nodes"],
+            "edges": spec["edges"],
+            "entrypoint": spec.get("entrypoint", None),
+            "version": __version__,
+            "stub_module": stub_module,
+        }
+        selected.append((template, context))
+
+    return selected
+
+
+def generate_from_spec(
+    spec_str: Union[str, bytes],
+    format_: Literal["yaml", "json"],
+    templates: list[Literal["stub", "implementation"]],
+    *,
+    language: Literal["python", "typescript"] = "python",
+    stub_module: Optional[str] = None,
+) -> list[str]:
+    """Generate agent code from a YAML specification file.
+
+    Args:
+        spec_str: Specification encoded as a string (or UTF-8 bytes)
+        format_: Format of the specification
+        templates: Sequence of templates to generate
+        language: Language to generate code for
+        stub_module If known, the module name to import the stub from.
+            This will be known in the CLI.
+
+    Returns:
+        list[str]: List of generated code files, in the same order as the templates.
+    """
+    spec = _parse_spec(spec_str, format_)
+
+    generated = []
+
+    for template, context in _select_templates(
+        spec, templates, language=language, stub_module=stub_module
+    ):
+        try:
+            code = template.render(**context)
             generated.append(code)
         except jinja2.TemplateError as e:
             raise AssertionError(
@@ -159,6 +537,55 @@ def generate_from_spec(
     return generated
 
 
+def _translate_template_errors(chunks: Iterator[str]) -> Iterator[str]:
+    """Raise template errors while streaming the way `generate_from_spec` does."""
+    try:
+        yield from chunks
+    except jinja2.TemplateError as e:
+        raise AssertionError(
+            f"Error rendering template: {str(e)}",
+        )
+
+
+def stream_from_spec(
+    spec_str: Union[str, bytes],
+    format_: Literal["yaml", "json"],
+    templates: list[Literal["stub", "implementation"]],
+    *,
+    language: Literal["python", "typescript"] = "python",
+    stub_module: Optional[str] = None,
+    fast_yaml: bool = False,
+) -> list[TemplateStream]:
+    """Generate agent code from a specification, without materializing it.
+
+    The specification is parsed and validated eagerly, so invalid specs are
+    reported before anything is written. The code itself is only rendered
+    while a stream is consumed, e.g. with `stream.dump(f, encoding="utf-8")`.
+
+    Args:
+        spec_str: Specification encoded as a string (or UTF-8 bytes)
+        format_: Format of the specification
+        templates: Sequence of templates to generate
+        language: Language to generate code for
+        stub_module If known, the module name to import the stub from.
+            This will be known in the CLI.
+        fast_yaml: Parse YAML with rapidyaml when it is installed. It briefly
+            redirects the process's stderr file descriptor, so only enable it
+            in programs that own the process, like the CLI.
+
+    Returns:
+        list[TemplateStream]: Streams of generated code, in the same order as the
+            templates.
+    """
+    spec = _parse_spec(spec_str, format_, fast_yaml=fast_yaml)
+    return [
+        TemplateStream(_translate_template_errors(template.generate(**context)))
+        for template, context in _select_templates(
+            spec, templates, language=language, stub_module=stub_module
+        )
+    ]
+
+
 def _add_to_graph(
     state_graph: StateGraph,
     spec: str,
@@ -171,7 +598,7 @@ def _add_to_graph(
         spec: Specification as a YAML string
         implementations (list[tuple[str, Callable]]): The list of implementations.
     """
-    spec_ = yaml.safe_load(spec)
+    spec_ = _load_yaml(spec)
 
     # Declare the state graph
     if not isinstance(spec_, dict):
@@ -244,7 +671,7 @@ def _add_to_graph_from_yaml(
         spec: Specification as a YAML string
         implementations (list[tuple[str, Callable]]): The list of implementations.
     """
-    spec_ = yaml.safe_load(spec)
+    spec_ = _load_yaml(spec)
     return _add_to_graph(
         state_graph,
         spec_,
@@ -0,0 +1,55 @@
+"""Pre-compile the jinja2 templates into python modules.
+
+The generated modules live in `langgraph_gen/_emitters` and let
+`generate_from_spec` skip parsing and compiling the templates at runtime.
+
+Run this script whenever a template in `langgraph_gen/assets` changes:
+
+    uv run python scripts/freeze_templates.py
+"""
+
+from pathlib import Path
+
+from langgraph_gen.generate import (
+    EMITTERS,
+    HERE,
+    TEMPLATES,
+    _get_environment,
+    _template_checksum,
+)
+
+EMITTERS_DIR = HERE / "_emitters"
+
+HEADER = '''\
+"""Pre-compiled `{name}` template.
+
+This is an automatically generated file. Do not modify it.
+To regenerate this file, run `scripts/freeze_templates.py`.
+"""
+
+CHECKSUM = "{checksum}"
+
+'''
+
+
+def freeze_template(name: str) -> Path:
+    """Compile a template and write it out as an emitter module."""
+    env = _get_environment()
+    code = env.compile(TEMPLATES[name], name, raw=True, defer_init=True)
+    path = EMITTERS_DIR / f"{EMITTERS[name]}.py"
+    header = HEADER.format(name=name, checksum=_template_checksum(name))
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(header + code + "\n")
+    return path
+
+
+def main() -> None:
+    """Freeze all templates."""
+    EMITTERS_DIR.mkdir(exist_ok=True)
+    (EMITTERS_DIR / "__init__.py").touch()
+    for name in EMITTERS:
+        print(f"Froze {name} into {freeze_template(name)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import shutil
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+from jinja2.environment import TemplateStream
+
+from langgraph_gen import __version__
+from langgraph_gen.cli import _write_streams, main
+
+SAMPLE_SPEC = Path(__file__).parent / "integrations" / "sample_01.yml"
+
+
+def _stream(*chunks: str, fail: bool = False) -> TemplateStream:
+    def generate() -> Iterator[str]:
+        yield from chunks
+        if fail:
+            raise RuntimeError("rendering failed")
+
+    return TemplateStream(generate())
+
+
+def test_write_streams(tmp_path: Path) -> None:
+    """Streams are written to their files, keeping existing permissions."""
+    stub, impl = tmp_path / "stub.py", tmp_path / "impl.py"
+    stub.write_text("old")
+    stub.chmod(0o640)
+
+    _write_streams([(_stream("stub ", "code"), stub), (_stream("impl"), impl)])
+
+    assert stub.read_text() == "stub code"
+    assert impl.read_text() == "impl"
+    assert stub.stat().st_mode & 0o777 == 0o640
+    assert sorted(tmp_path.iterdir()) == [impl, stub]
+
+
+def test_write_streams_failure_keeps_files(tmp_path: Path) -> None:
+    """A failure while rendering leaves existing files untouched."""
+    stub, impl = tmp_path / "stub.py", tmp_path / "impl.py"
+    stub.write_text("old stub")
+    impl.write_text("old impl")
+
+    with pytest.raises(RuntimeError):
+        _write_streams(
+            [(_stream("new stub"), stub), (_stream("partial", fail=True), impl)]
+        )
+
+    assert stub.read_text() == "old stub"
+    assert impl.read_text() == "old impl"
+    assert sorted(tmp_path.iterdir()) == [impl, stub]
+
+
+def test_write_streams_errors_name_the_target(tmp_path: Path) -> None:
+    """Errors name the file being generated, not the temporary file."""
+    stub = tmp_path / "missing" / "stub.py"
+
+    with pytest.raises(FileNotFoundError) as exc_info:
+        _write_streams([(_stream("stub"), stub)])
+
+    assert exc_info.value.filename == str(stub)
+
+
+def _no_argparse(**kwargs: object) -> None:
+    raise AssertionError("argparse should not be used")
+
+
+def test_main_version(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """A lone `--version` is answered without building the argparse parser."""
+    monkeypatch.setattr("langgraph_gen.cli._parse_args", _no_argparse)
+    monkeypatch.setattr(sys, "argv", ["langgraph-gen", "-V"])
+
+    main()
+
+    assert capsys.readouterr() == (f"langgraph-gen {__version__}\n", "")
+
+
+def test_main_generates_without_argparse(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """Common command lines are parsed by the fast parser and generate code."""
+    spec = tmp_path / "spec.yml"
+    shutil.copy(SAMPLE_SPEC, spec)
+    monkeypatch.setattr("langgraph_gen.cli._parse_args", _no_argparse)
+    monkeypatch.setattr(sys, "argv", ["langgraph-gen", str(spec), "-l", "typescript"])
+
+    main()
+
+    stub, impl = tmp_path / "spec.ts", tmp_path / "spec_impl.ts"
+    assert capsys.readouterr() == (
+        "Successfully generated files:\n"
+        f"- Stub file:           {stub}\n"
+        f"- Implementation file: {impl}\n",
+        "",
+    )
+    assert "createAgent" in stub.read_text()
+    assert impl.exists()
+
+
+def test_main_invalid_arguments(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """Command lines the fast parser rejects get argparse's help and errors."""
+    monkeypatch.setattr(sys, "argv", ["langgraph-gen"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 2
+    out, err = capsys.readouterr()
+    assert "Examples:" in out
+    assert "the following arguments are required: input" in err
+    assert "Error: Invalid arguments" in err
+
+
+def test_main_version_with_argparse(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture
+) -> None:
+    """The version is printed to stdout when argparse handles `--version`."""
+    monkeypatch.setattr(sys, "argv", ["langgraph-gen", "spec.yml", "--version"])
+
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+
+    assert exc_info.value.code == 0
+    assert capsys.readouterr() == (f"langgraph-gen {__version__}\n", "")
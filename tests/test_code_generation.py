@@ -1,6 +1,19 @@
 import ast
+import importlib
 
-from langgraph_gen.generate import generate_from_spec
+import pytest
+import yaml
+
+from langgraph_gen import generate
+from langgraph_gen.generate import (
+    EMITTERS,
+    _UnsupportedYaml,
+    _load_yaml,
+    _load_yaml_with_ryml,
+    _template_checksum,
+    generate_from_spec,
+    stream_from_spec,
+)
 
 SAMPLE_YAML = """\
 # agent_graph.yaml
@@ -177,3 +190,148 @@ def test_generation_with_human_names() -> None:
     exec(stub, globals_dict)
 
     exec(impl, globals_dict)
+
+
+@pytest.mark.parametrize("language", ["python", "typescript"])
+def test_stream_matches_generate(language: str) -> None:
+    """Streamed code should be identical to the generated code."""
+    kwargs = {
+        "templates": ["stub", "implementation"],
+        "language": language,
+        "stub_module": "agent",
+    }
+    generated = generate_from_spec(SAMPLE_YAML, "yaml", **kwargs)
+    streamed = stream_from_spec(SAMPLE_YAML, "yaml", **kwargs)
+    assert ["".join(stream) for stream in streamed] == generated
+
+
+def test_stream_template_errors_match_generate(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Template errors surface the same way whether streaming or not."""
+    broken = generate._get_environment().from_string("{{ missing.attribute }}")
+    monkeypatch.setattr(generate, "_get_template", lambda name: broken)
+
+    with pytest.raises(AssertionError, match="Error rendering template"):
+        generate_from_spec(SAMPLE_YAML, "yaml", templates=["stub"])
+    (stream,) = stream_from_spec(SAMPLE_YAML, "yaml", templates=["stub"])
+    with pytest.raises(AssertionError, match="Error rendering template"):
+        "".join(stream)
+
+
+YAML_DOCUMENTS = [
+    SAMPLE_YAML,
+    NON_MACHINE_FRIENDLY_NAMES_YAML,
+    "",
+    "a: [1, -2, 3.5, .inf, yes, Off, ~, null, '', 'x', \"1\"]\n",
+    "a: &x 1\nb: *x\n",
+    "- 0x1f\n- 0755\n- 2001-12-14\n- 1_000\n- 1e3\n",
+    "1: a\n'2': b\nc: |\n  multi\n  line\n",
+    "a: [+., -., ._, -.5, +.5, .5, --.inf, -.inf, +.INF, 1., 1_0.5_, 1:30.5]\n",
+    "a: [0b10, 1:30, 00, 09, -0, +1, 1__0, -foo, +, -, .]\n",
+    "<<: {b: 1}\nc: 2\n",
+    "'<<': {b: 1}\n",
+    "a: 1\r\nb: |\r\n  c\r\n",
+    "a: |\n  no final line break",
+    "a: \x85\n",
+    "a: {k: v\n\n  }\n",
+    "a: [?x, {?y}]\n",
+    "\ufeff ...",
+]
+
+# Documents that PyYAML's safe loader rejects
+INVALID_YAML_DOCUMENTS = [
+    "...\n",
+    ": x\n",
+    "a: @x\n",
+    "a: `x`\n",
+    "a: }\n",
+    "a:\tb\n",
+    "a: \x07\n",
+    "%x\na: 1\n",
+    "a: |1x\n",
+    ">\n---\n",
+]
+
+
+@pytest.mark.parametrize("fast", [False, True])
+@pytest.mark.parametrize("document", YAML_DOCUMENTS)
+def test_load_yaml_matches_pyyaml(document: str, fast: bool) -> None:
+    """The YAML loader should produce the same objects as PyYAML's safe loader."""
+    assert _load_yaml(document, fast=fast) == yaml.safe_load(document)
+    assert _load_yaml(document.encode(), fast=fast) == yaml.safe_load(document)
+
+
+@pytest.mark.parametrize("document", YAML_DOCUMENTS)
+def test_ryml_matches_pyyaml(document: str) -> None:
+    """The rapidyaml fast path either matches PyYAML or defers to it."""
+    ryml = pytest.importorskip("ryml")
+    try:
+        loaded = _load_yaml_with_ryml(document)
+    except (_UnsupportedYaml, ryml.ExceptionParse):
+        return
+    assert loaded == yaml.safe_load(document)
+
+
+@pytest.mark.parametrize("document", INVALID_YAML_DOCUMENTS)
+def test_load_yaml_rejects_invalid_documents(document: str) -> None:
+    """Documents rejected by PyYAML are rejected with the fast path too."""
+    with pytest.raises(yaml.YAMLError):
+        _load_yaml(document, fast=True)
+
+
+@pytest.mark.parametrize("document", [SAMPLE_YAML, NON_MACHINE_FRIENDLY_NAMES_YAML])
+def test_ryml_loads_specs(document: str) -> None:
+    """Regular specs are loaded by rapidyaml, without deferring to PyYAML."""
+    pytest.importorskip("ryml")
+    assert _load_yaml_with_ryml(document) == yaml.safe_load(document)
+
+
+@pytest.mark.parametrize("document", [b"a: [1, 2\n", "a: 1\n".encode("utf-16")])
+def test_load_yaml_is_quiet(document: bytes, capfd: pytest.CaptureFixture) -> None:
+    """Documents rapidyaml can't parse don't produce output."""
+    try:
+        _load_yaml(document, fast=True)
+    except yaml.YAMLError:
+        pass
+    assert capfd.readouterr() == ("", "")
+
+
+def test_library_does_not_use_ryml(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Only the CLI opts into rapidyaml, library callers always get PyYAML."""
+
+    def fail(spec: str) -> None:
+        raise AssertionError("rapidyaml used")
+
+    monkeypatch.setattr(generate, "_load_yaml_with_ryml", fail)
+    assert generate_from_spec(SAMPLE_YAML, "yaml", templates=["stub"])
+    assert stream_from_spec(SAMPLE_YAML, "yaml", templates=["stub"])
+
+
+@pytest.mark.parametrize("name", sorted(EMITTERS))
+def test_emitters_are_up_to_date(name: str) -> None:
+    """Pre-compiled templates must match the template sources."""
+    emitter = importlib.import_module(f"langgraph_gen._emitters.{EMITTERS[name]}")
+    assert emitter.CHECKSUM == _template_checksum(name), (
+        "Emitter is stale, run `make freeze_templates`."
+    )
+
+
+@pytest.mark.parametrize("language", ["python", "typescript"])
+def test_stale_emitters_fall_back_to_template_source(
+    monkeypatch: pytest.MonkeyPatch, language: str
+) -> None:
+    """Stale emitters are ignored in favor of compiling the template source."""
+    kwargs = {
+        "templates": ["stub", "implementation"],
+        "language": language,
+        "stub_module": "agent",
+    }
+    expected = generate_from_spec(SAMPLE_YAML, "yaml", **kwargs)
+
+    monkeypatch.setattr(generate, "_template_checksum", lambda name: "stale")
+    generate._get_template.cache_clear()
+    try:
+        for name in EMITTERS:
+            assert "_emitters" not in generate._get_template(name).filename
+        assert generate_from_spec(SAMPLE_YAML, "yaml", **kwargs) == expected
+    finally:
+        generate._get_template.cache_clear()
@@ -0,0 +1,62 @@
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from langgraph_gen._fastargs import parse
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["spec.yml"], ("spec.yml", "python", None, None)),
+        (
+            ["spec.yml", "-l", "typescript", "-o", "out.ts"],
+            ("spec.yml", "typescript", "out.ts", None),
+        ),
+        (
+            ["--language=typescript", "spec.yml", "--implementation", "impl.ts"],
+            ("spec.yml", "typescript", None, "impl.ts"),
+        ),
+        (
+            ["-ltypescript", "-oout.ts", "spec.yml"],
+            ("spec.yml", "typescript", "out.ts", None),
+        ),
+        (
+            ["spec.yml", "-l", "python", "-l", "typescript"],
+            ("spec.yml", "typescript", None, None),
+        ),
+    ],
+)
+def test_parse(
+    argv: list[str], expected: tuple[str, str, Optional[str], Optional[str]]
+) -> None:
+    """Well-formed command lines are parsed like argparse would."""
+    args = parse(argv)
+    assert args is not None
+    input_, language, output, implementation = expected
+    assert args.input == Path(input_)
+    assert args.language == language
+    assert args.output == (None if output is None else Path(output))
+    assert args.implementation == (
+        None if implementation is None else Path(implementation)
+    )
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["-h"],
+        ["spec.yml", "--version"],
+        ["spec.yml", "other.yml"],
+        ["spec.yml", "--lang", "typescript"],
+        ["spec.yml", "--unknown"],
+        ["spec.yml", "-o"],
+        ["spec.yml", "-o", "--implementation", "impl.py"],
+        ["--", "spec.yml"],
+    ],
+)
+def test_parse_defers_to_argparse(argv: list[str]) -> None:
+    """Help, version, unusual and invalid command lines are left to argparse."""
+    assert parse(argv) is None